@@ -75,6 +75,18 @@ def PyUnicode_UTF8_LENGTH(obj: PyASCIIObject) -> int:
     return _PyUnicode_UTF8_LENGTH(obj)
 
 
+# Character types by kind value
+_KIND_TYPES: dict[int, Type[c_wchar | c_uint8 | c_uint16 | c_uint32]] = {
+    0: c_wchar,
+    1: c_uint8,
+    2: c_uint16,
+    4: c_uint32,
+}
+
+# LegacyUnion fields of non-compact string buffers by kind value
+_LEGACY_DATA_FIELDS: dict[int, str] = {1: "latin1", 2: "ucs2", 4: "ucs4"}
+
+
 class State(IntEnum):
     """State of the string object (SSTATE constants)."""
 
@@ -93,13 +105,7 @@ class Kind(IntEnum):
     PyUnicode_4BYTE = 4
 
     def type_info(self) -> Type[c_wchar | c_uint8 | c_uint16 | c_uint32]:
-        types_map = {
-            0: c_wchar,
-            1: c_uint8,
-            2: c_uint16,
-            4: c_uint32,
-        }
-        return types_map[int(self)]
+        return _KIND_TYPES[self]
 
 
 class LegacyUnion(Union):
@@ -164,30 +170,26 @@ class PyASCIIObject(PyObject[str, None, None], IsGC):
 
     @property
     def buffer(self) -> Array:
-        utf8_length_offset: int = PyUnicodeObject.utf8_length.offset  # type: ignore
-        data_offset: int = PyUnicodeObject.data.offset  # type: ignore
         addr = addressof(self)
 
         if self.compact:
-            # Get the str subtype type mapping
-            subtype = Kind(self.kind).type_info()
             if self.ascii:
                 # ASCII buffer comes right after wstr
                 subtype = c_char
-                addr += utf8_length_offset
+                addr += _UTF8_LENGTH_OFFSET
             else:
-                # UCS1/2/4 buffer comes right after wstr
-                addr += data_offset
+                # UCS1/2/4 buffer comes right after wstr, typed by kind
+                try:
+                    subtype = _KIND_TYPES[self.kind]
+                except KeyError:
+                    raise ValueError(f"Unknown kind: {self.kind}") from None
+                addr += _DATA_OFFSET
             return (subtype * self.length).from_address(addr)
 
-        if self.kind == Kind.PyUnicode_1BYTE:
-            return self.data.latin1  # type: ignore
-        elif self.kind == Kind.PyUnicode_2BYTE:
-            return self.data.ucs2  # type: ignore
-        elif self.kind == Kind.PyUnicode_4BYTE:
-            return self.data.ucs4  # type: ignore
-
-        raise ValueError(f"Unknown kind: {self.kind}")
+        kind = self.kind
+        if (data_field := _LEGACY_DATA_FIELDS.get(kind)) is None:
+            raise ValueError(f"Unknown kind: {kind}")
+        return getattr(self.data, data_field)  # type: ignore
 
     @bind_api(pythonapi["PyUnicode_Substring"])
     def Substring(self, start: int, end: int) -> PyUnicodeObject:
@@ -234,3 +236,8 @@ class PyUnicodeObject(PyCompactUnicodeObject):
             "utf8": "c_char_p",
             "wstr_length": "Py_ssize_t",
         }
+
+
+# Offsets of the compact string buffers, which start at these fields
+_UTF8_LENGTH_OFFSET: int = PyUnicodeObject.utf8_length.offset
+_DATA_OFFSET: int = PyUnicodeObject.data.offset
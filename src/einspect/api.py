@@ -18,6 +18,7 @@ __all__ = (
     "Py_hash_t",
     "uintptr_t",
     "PTR_SIZE",
+    "ARRAY_TYPE_CACHE_SIZE",
     "PyObj_FromPtr",
     "ALIGNMENT",
     "ALIGNMENT_SHIFT",
@@ -43,6 +44,9 @@ uintptr_t = ctypes.c_uint64
 PTR_SIZE = sizeof(c_void_p)
 """Size of a pointer in bytes."""
 
+ARRAY_TYPE_CACHE_SIZE = 256
+"""Max number of variable length array types cached by size, for each struct."""
+
 # Alignments (must be powers of 2)
 # https://github.com/python/cpython/blob/3.11/Objects/obmalloc.c#L878-L884
 if sizeof(c_void_p) > 4:
@@ -197,11 +201,8 @@ PyObj_FromPtr: Callable[[int], object] = _ctypes.PyObj_FromPtr
 
 def address(obj: Any) -> int:
     """Return the address of a python object. Same as id()."""
-    source = ctypes.py_object(obj)
-    addr = ctypes.c_void_p.from_buffer(source).value
-    if addr is None:
-        raise ValueError("address: NULL object")  # pragma: no cover
-    return addr
+    # In CPython, id() is the object address
+    return id(obj)
 
 
 def align_size(size: int, alignment: int = ALIGNMENT) -> int:
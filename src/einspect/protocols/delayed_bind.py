@@ -34,11 +34,18 @@ def bind_api(py_api: FuncPtr) -> Callable[[_F], _F]:
 
 
 # noinspection PyPep8Naming
-class delayed_bind(property):
+class delayed_bind:
+    """
+    Descriptor binding a FuncPtr as a method, resolving its types on first access.
+
+    After the first access, the descriptor replaces itself on its class with a
+    bound_api binding the FuncPtr, so instances need no __dict__ cache.
+    """
+
     def __init__(self, py_api: FuncPtr, func: _F):
-        super().__init__()
         # Use __func__ if staticmethod
-        if isinstance(func, staticmethod):
+        self.is_static = isinstance(func, staticmethod)
+        if self.is_static:
             func = func.__func__
         self.func = func
         self.__doc__ = func.__doc__
@@ -121,29 +128,46 @@ class delayed_bind(property):
                     else "None",
                 )
 
-        # Called as class method, return directly without binding
-        if instance is None:
-            return self.py_api  # type: ignore
+        # Replace this descriptor on its class, so later lookups skip the type
+        # resolution. The first access returns what later ones will.
+        return self._install(owner_cls).__get__(instance, owner_cls)
 
-        try:
-            cache = instance.__dict__
-        except AttributeError:
-            raise TypeError(
-                "delayed_bind requires class to support __dict__."
-            ) from None
+    def _install(self, owner_cls: type) -> bound_api | staticmethod:
+        """Set the resolved FuncPtr on the class defining this descriptor."""
+        if self.is_static:
+            resolved = staticmethod(self.py_api)
+        else:
+            resolved = bound_api(self.py_api, self.func)
 
-        bound_func = MethodType(self.py_api, instance)
+        for cls in owner_cls.__mro__:
+            if cls.__dict__.get(self.attrname) is self:
+                setattr(cls, self.attrname, resolved)
+                break
 
-        try:
-            cache[self.attrname] = bound_func
-        except TypeError:
-            msg = (
-                f"The '__dict__' attribute on {type(instance).__name__!r} instance "
-                f"does not support item assignment for caching {self.attrname!r} property."
-            )
-            raise TypeError(msg) from None
+        return resolved
+
+
+class bound_api:
+    """
+    Descriptor binding a resolved FuncPtr as a method.
 
-        return bound_func
+    Class access returns the FuncPtr, instance access a MethodType of it,
+    so calls go straight to the FuncPtr without a wrapper function.
+    """
+
+    __slots__ = ("py_api", "func")
+
+    def __init__(self, py_api: FuncPtr, func: Callable) -> None:
+        self.py_api = py_api
+        self.func = func
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.func.__qualname__!r}>"
+
+    def __get__(self, instance: object | None, owner_cls: type | None = None):
+        if instance is None:
+            return self.py_api
+        return MethodType(self.py_api, instance)
 
 
 def _get_defining_class_of_bound_method(method, current_cls) -> type:
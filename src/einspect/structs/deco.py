@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import ctypes
 import logging
+import struct as struct_
+import sys
 import typing
-from ctypes import POINTER, Structure
-from functools import cached_property, partial
-from typing import Callable, Literal, Sequence, Tuple, Type, TypeVar, overload
+from ctypes import POINTER, Structure, _Pointer, _SimpleCData
+from functools import partial
+from types import SimpleNamespace
+from typing import Any, Callable, Literal, Sequence, Tuple, Type, TypeVar, overload
 
-import typing_extensions
 from typing_extensions import get_args, get_type_hints
 
 from einspect.protocols.type_parse import (
@@ -20,15 +22,47 @@ from einspect.types import NULL, Pointer, PyCFuncPtrType, _SelfPtr
 
 __all__ = ("struct", "Struct")
 
-# noinspection PyUnresolvedReferences, PyProtectedMember
-AnnotatedAlias = typing_extensions._AnnotatedAlias
-
 log = logging.getLogger(__name__)
 
 _T = TypeVar("_T", bound=Type[Structure])
 
+# Hint types that are already valid _fields_ types, skipping convert_type_hints.
+# Structure subclasses are excluded since they are converted to POINTER(cls).
+_CTYPES_FIELD_TYPES = (_SimpleCData, _Pointer, ctypes.Array)
+
 FieldsType = Sequence[typing.Union[Tuple[str, type], Tuple[str, type, int]]]
 
+# Type of the field descriptors of ctypes structures
+_CField: type = type(type("_", (Structure,), {"_fields_": [("x", ctypes.c_int)]}).x)
+
+# struct module codes of integers by size, for reading raw field values
+_INT_CODES = {1: "b", 2: "h", 4: "i", 8: "q"}
+
+_AnnotatedAlias: type | None = None
+
+
+def _get_annotated_alias() -> type:
+    """Return the runtime type of Annotated hints, imported on first use."""
+    global _AnnotatedAlias
+    if _AnnotatedAlias is None:
+        # noinspection PyUnresolvedReferences, PyProtectedMember
+        from typing_extensions import _AnnotatedAlias as alias
+
+        _AnnotatedAlias = alias
+    return _AnnotatedAlias
+
+
+def _get_own_type_hints(cls: type, localns: dict[str, Any]) -> dict[str, Any]:
+    """
+    Return the resolved type hints of annotations defined on cls only.
+
+    Unlike get_type_hints(cls), superclass annotations are not evaluated again
+    for every subclass, since only the class's own hints become _fields_.
+    """
+    globalns = getattr(sys.modules.get(cls.__module__), "__dict__", {})
+    own = SimpleNamespace(__annotations__=cls.__dict__.get("__annotations__", {}))
+    return get_type_hints(own, globalns, localns, include_extras=True)
+
 
 @overload
 def struct(*, fields: FieldsType) -> Callable[[_T], _T]:
@@ -72,37 +106,36 @@ def _struct(cls: _T, __fields: FieldsType | None = None) -> _T:
     # Locals dict for type hint resolution
     hint_locals = {cls.__name__: cls}
     try:
-        hints = get_type_hints(cls, None, hint_locals, include_extras=True)
+        hints = _get_own_type_hints(cls, hint_locals)
     except (TypeError, NameError):
         # Normalize annotations of py_object subscripts
         fix_ctypes_generics(cls.__annotations__, cls.__name__)
-        hints = get_type_hints(cls, None, hint_locals, include_extras=True)
+        hints = _get_own_type_hints(cls, hint_locals)
 
     for name, type_hint in hints.items():
         # Use override if exists
         if f := fields_overrides.get(name):
             fields.append(f)
             continue
-        # Skip actual values like _fields_
-        if name.startswith("_") and name.endswith("_"):
-            continue
-        # Skip callables
-        if type_hint == Callable:
-            continue
-        # Since get_type_hints also gets superclass hints, skip them
-        if name not in cls.__annotations__:
+        # Skip actual values like _fields_, and callables
+        if name[0] == "_" == name[-1] or type_hint == Callable:
             continue
 
         # For Annotated, directly use fields 1 and 2
-        if type(type_hint) is AnnotatedAlias:
-            args = get_args(type_hint)
-            res = (name, *args[1:3])
-            log.debug(f"Annotated: {type_hint} -> {res}")
-            fields.append((name, *args[1:3]))
-            continue
+        if hasattr(type_hint, "__metadata__") and (
+            type(type_hint) is _get_annotated_alias()
+        ):
+            field = (name, *get_args(type_hint)[1:3])
+            log.debug("Annotated: %s -> %s", type_hint, field)
+        # Raw ctypes types need no conversion
+        elif isinstance(type_hint, PyCFuncPtrType) or (
+            isinstance(type_hint, type) and issubclass(type_hint, _CTYPES_FIELD_TYPES)
+        ):
+            field = (name, type_hint)
+        else:
+            field = (name, convert_type_hints(type_hint, cls))
 
-        type_hint = convert_type_hints(type_hint, cls)
-        fields.append((name, type_hint))
+        fields.append(field)
 
     # We must only set this once as _fields_ is final
     try:
@@ -139,6 +172,60 @@ def _cast_field(field_type, value):
     return value
 
 
+def _field_code(field_type: type) -> str:
+    """Return the struct module format of a ctypes field type, by its layout."""
+    size = ctypes.sizeof(field_type)
+    if issubclass(field_type, _SimpleCData):
+        code = field_type._type_
+        if code in "fd?c":
+            return code
+        if code in "bhilq":
+            return _INT_CODES[size]
+        # Unsigned integers, and pointer-like types read as addresses
+        if code in "BHILQPzZO":
+            return _INT_CODES[size].upper()
+    elif issubclass(field_type, (_Pointer, ctypes._CFuncPtr)):
+        return _INT_CODES[size].upper()
+    # Arrays, nested structures and others are read as raw bytes
+    return f"{size}s"
+
+
+def _snapshot_reader(
+    cls: type,
+) -> tuple[struct_.Struct, tuple[str, ...], tuple[str, ...]]:
+    """
+    Return a struct.Struct reading the fields of cls in one call, the field names
+    it reads, and the names of fields (bitfields, overlaps) read through ctypes.
+    """
+    if (reader := cls.__dict__.get("_snapshot_reader_")) is not None:
+        return reader
+
+    fmt = ["="]
+    names = []
+    others = []
+    pos = 0
+    for name, field_type, *bits in cls._fields_map_.values():
+        # Properties may shadow fields of bases, find the field descriptor itself
+        field = next(
+            f
+            for base in cls.__mro__
+            if isinstance(f := base.__dict__.get(name), _CField)
+        )
+        offset = field.offset
+        if bits or offset < pos:
+            others.append(name)
+            continue
+        if offset > pos:
+            fmt.append(f"{offset - pos}x")
+        fmt.append(_field_code(field_type))
+        names.append(name)
+        pos = offset + ctypes.sizeof(field_type)
+
+    reader = (struct_.Struct("".join(fmt)), tuple(names), tuple(others))
+    cls._snapshot_reader_ = reader
+    return reader
+
+
 class UnionMeta(type(ctypes.Union)):
     def __init__(self, name, bases, mapping, **kwargs) -> None:
         super().__init__(name, bases, mapping, **kwargs)
@@ -149,6 +236,12 @@ class StructMeta(type(ctypes.Structure)):
     def __init__(self, name, bases, mapping, **kwargs) -> None:
         super().__init__(name, bases, mapping, **kwargs)
         _struct(self)  # type: ignore
+        # Built once per class, so field writes never touch the instance __dict__
+        self._fields_map_ = {
+            f[0]: f
+            for base in reversed(self.__mro__)
+            for f in base.__dict__.get("_fields_", ())
+        }
 
 
 class Union(ctypes.Union, AsRef, Display, metaclass=UnionMeta):
@@ -161,12 +254,24 @@ class Struct(Structure, AsRef, Display, metaclass=StructMeta):
     """Defines a ctypes.Structure subclass using type hints."""
 
     _fields_: typing.List[typing.Union[Tuple[str, type], Tuple[str, type, int]]]
-
-    @cached_property
-    def _fields_map_(self) -> dict[str, tuple[str, type] | tuple[str, type, int]]:
-        """Returns a dict of field name to field tuple. Includes inherited fields."""
-        super_fields = super()._fields_ if hasattr(super(), "_fields_") else {}
-        return {**super_fields, **{f[0]: f for f in self._fields_}}
+    _fields_map_: typing.Dict[
+        str, typing.Union[Tuple[str, type], Tuple[str, type, int]]
+    ]
+    """Mapping of field name to field tuple. Includes inherited fields."""
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Return a dict of all field values, read from memory in one pass.
+
+        Values are raw: pointers are int addresses (0 for NULL), and arrays or
+        nested structures are bytes. Much faster than reading each field through
+        ctypes when many fields are needed.
+        """
+        reader, names, others = _snapshot_reader(type(self))
+        values = dict(zip(names, reader.unpack_from(self)))
+        for name in others:
+            values[name] = getattr(self, name)
+        return values
 
     def __setattr__(self, key, value):
         # Overrides for field assignments
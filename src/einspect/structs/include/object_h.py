@@ -1,6 +1,7 @@
 """https://github.com/python/cpython/blob/3.11/Include/object.h"""
 from __future__ import annotations
 
+from collections import namedtuple
 from ctypes import PYFUNCTYPE, c_char_p, c_int, c_void_p, py_object
 from enum import IntEnum, IntFlag
 
@@ -43,6 +44,7 @@ __all__ = (
     "sendfunc",
     "PySendResult",
     "TpFlags",
+    "TP_FLAGS",
     "PyBufferProcs",
     "PyAsyncMethods",
     "PyNumberMethods",
@@ -85,10 +87,12 @@ initproc = PYFUNCTYPE(c_int, py_object, py_object, py_object)
 newfunc = PYFUNCTYPE(py_object, py_object, py_object, py_object)
 allocfunc = PYFUNCTYPE(py_object, py_object, Py_ssize_t)
 
+_PyObjectPtr = ptr[py_object]
+
 # PyObject *(*vectorcallfunc)(PyObject *callable, PyObject *const *args, size_t nargsf, PyObject *kwnames)
-vectorcallfunc = PYFUNCTYPE(py_object, py_object, ptr[py_object], Py_ssize_t, py_object)
+vectorcallfunc = PYFUNCTYPE(py_object, py_object, _PyObjectPtr, Py_ssize_t, py_object)
 # PySendResult (*sendfunc)(PyObject *iter, PyObject *value, PyObject **result)
-sendfunc = PYFUNCTYPE(c_int, py_object, py_object, ptr[py_object])
+sendfunc = PYFUNCTYPE(c_int, py_object, py_object, _PyObjectPtr)
 
 
 class PySendResult(IntEnum):
@@ -158,6 +162,14 @@ class TpFlags(IntFlag):
     HAVE_VERSION_TAG = 1 << 18
 
 
+# Plain int TpFlags values, as bitwise ops with IntFlag members dispatch to
+# the Python-level IntFlag.__rand__, which is slow on hot tp_flags checks.
+TP_FLAGS = namedtuple("TpFlagsValues", TpFlags.__members__.keys())._make(
+    int(flag) for flag in TpFlags.__members__.values()
+)
+"""Mapping of TpFlags names to int values."""
+
+
 class PyAsyncMethods(Struct):
     am_await: unaryfunc
     am_aiter: unaryfunc
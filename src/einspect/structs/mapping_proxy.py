@@ -4,7 +4,7 @@ from types import MappingProxyType
 from typing import TypeVar
 
 from einspect.structs.py_dict import PyDictObject
-from einspect.structs.py_object import Fields, PyObject
+from einspect.structs.py_object import Fields, PyObject, static_fields
 from einspect.structs.traits import IsGC
 from einspect.types import ptr
 
@@ -24,6 +24,7 @@ class MappingProxyObject(PyObject[MappingProxyType, _KT, _VT_co], IsGC):
 
     mapping: ptr[PyDictObject[_KT, _VT_co]]
 
+    @static_fields
     def _format_fields_(self) -> Fields:
         return {
             **super()._format_fields_(),
@@ -13,14 +13,17 @@ from ctypes import (
     c_uint32,
     c_uint64,
     pythonapi,
+    sizeof,
 )
+from functools import lru_cache
 from typing import Dict, TypeVar
 
 from typing_extensions import Annotated
 
+from einspect.api import ARRAY_TYPE_CACHE_SIZE
 from einspect.protocols.delayed_bind import bind_api
 from einspect.structs.deco import Struct
-from einspect.structs.py_object import Fields, PyObject
+from einspect.structs.py_object import Fields, PyObject, static_fields
 from einspect.structs.traits import IsGC
 from einspect.types import Array, ptr
 
@@ -30,6 +33,38 @@ __all__ = ("PyDictObject",)
 _KT = TypeVar("_KT")
 _VT = TypeVar("_VT")
 
+# Indices (type, name) by dk_log2_size, the size of an indice depends on dk_size
+_DK_INDICES_TYPES: tuple[tuple[type[_SimpleCData], str], ...] = (
+    ((c_char, "c_char"),) * 8  # dk_size <= 0xff
+    + ((c_int16, "c_int16"),) * 8  # dk_size <= 0xffff
+    + ((c_int32, "c_int32"),) * 16  # dk_size <= 0xffffffff
+    + ((c_int64, "c_int64"),) * 32
+)
+
+# Signed struct format characters of indices by item size
+_DK_INDICES_FORMATS = {1: "b", 2: "h", 4: "i", 8: "q"}
+
+
+@lru_cache(maxsize=ARRAY_TYPE_CACHE_SIZE)
+def _dk_indices_array(log2_size: int) -> type[Array[int]]:
+    """Return the ctypes array type of dk_indices for a dk_log2_size."""
+    return _DK_INDICES_TYPES[log2_size][0] * (1 << log2_size)
+
+
+@lru_cache(maxsize=None)
+def _dk_format_fields(indice_name: str) -> Fields:
+    """Return the PyDictKeysObject display fields for an indice type name."""
+    return {
+        "dk_refcnt": "Py_ssize_t",
+        "dk_log2_size": "c_uint8",
+        "dk_log2_index_bytes": "c_uint8",
+        "dk_kind": "c_uint8",
+        "dk_version": "c_uint32",
+        "dk_usable": "Py_ssize_t",
+        "dk_nentries": "Py_ssize_t",
+        "dk_indices": f"Array[{indice_name}]",
+    }
+
 
 class PyDictKeysObject(Struct):
     """
@@ -64,36 +99,38 @@ class PyDictKeysObject(Struct):
 
     @property
     def dk_indices(self) -> Array[int]:
-        items_addr = addressof(self._dk_indices)
-        item_type = self._dk_indices_type()[0]
-        arr = item_type * self._dk_size
-        return arr.from_address(items_addr)
+        items_addr = addressof(self) + _DK_INDICES_OFFSET
+        return _dk_indices_array(self.dk_log2_size).from_address(items_addr)
+
+    def dk_indices_view(self) -> memoryview:
+        """
+        Return a memoryview of dk_indices as signed integers.
+
+        The view is over the dict's memory, not a copy. Unlike dk_indices (which
+        uses c_char for 1 byte indices), items are always ints, so DKIX_EMPTY (-1)
+        and DKIX_DUMMY (-2) can be found directly. Consumers of the buffer
+        protocol (like numpy.frombuffer) get the matching integer dtype.
+        """
+        log2_size = self.dk_log2_size
+        itemsize = sizeof(_DK_INDICES_TYPES[log2_size][0])
+        buf = (c_char * (itemsize << log2_size)).from_address(
+            addressof(self) + _DK_INDICES_OFFSET
+        )
+        return memoryview(buf).cast("B").cast(_DK_INDICES_FORMATS[itemsize])
 
     @property
     def _dk_size(self) -> int:
         return 1 << self.dk_log2_size
 
-    def _dk_indices_type(self) -> tuple[_SimpleCData, str]:
-        if self._dk_size <= 0xFF:
-            return c_char, "c_char"
-        elif self._dk_size <= 0xFFFF:
-            return c_int16, "c_int16"
-        elif self._dk_size <= 0xFFFFFFFF:  # pragma: no branch
-            return c_int32, "c_int32"
-        return c_int64, "c_int64"  # pragma: no cover
+    def _dk_indices_type(self) -> tuple[type[_SimpleCData], str]:
+        return _DK_INDICES_TYPES[self.dk_log2_size]
 
     def _format_fields_(self) -> Fields:
-        indice_type, indice_name = self._dk_indices_type()
-        return {
-            "dk_refcnt": "Py_ssize_t",
-            "dk_log2_size": "c_uint8",
-            "dk_log2_index_bytes": "c_uint8",
-            "dk_kind": "c_uint8",
-            "dk_version": "c_uint32",
-            "dk_usable": "Py_ssize_t",
-            "dk_nentries": "Py_ssize_t",
-            "dk_indices": f"Array[{indice_name}]",
-        }
+        return _dk_format_fields(self._dk_indices_type()[1])
+
+
+# Offset of the variable length dk_indices, to skip creating the empty field array
+_DK_INDICES_OFFSET: int = PyDictKeysObject._dk_indices.offset
 
 
 class PyDictValues(Struct):
@@ -117,6 +154,16 @@ class PyDictObject(PyObject[dict, _KT, _VT], IsGC):
     # and values are stored in ma_values
     ma_values: ptr[PyDictValues]
 
+    @property
+    def is_split(self) -> bool:
+        """
+        Return True if the dict uses a split table (values in ma_values).
+
+        Not cached, since a split table is combined on resize or some insertions.
+        """
+        return bool(self.ma_values)
+
+    @static_fields
     def _format_fields_(self) -> Fields:
         return {
             **super()._format_fields_(),
@@ -144,6 +191,25 @@ class PyDictObject(PyObject[dict, _KT, _VT], IsGC):
             TypeError: if the key is not hashable.
         """
 
+    @bind_api(pythonapi["_PyDict_GetItem_KnownHash"])
+    def GetItemKnownHash(self, key: _KT, key_hash: int) -> POINTER(PyObject):
+        """
+        Return a pointer to the value object at key, or NULL if the key is not found.
+
+        Same as GetItem, but uses a precomputed hash(key) instead of rehashing key.
+        """
+
+    @bind_api(pythonapi["_PyDict_SetItem_KnownHash"])
+    def SetItemKnownHash(self, key: _KT, val: _VT, key_hash: int) -> int:
+        """
+        Set a value to a given key, using a precomputed hash(key).
+
+        This function does not steal a reference to val.
+
+        Returns:
+            0 on success or -1 on failure.
+        """
+
     @bind_api(pythonapi["PyDict_DelItem"])
     def DelItem(self, key: _KT) -> int:
         """
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from ctypes import c_void_p, cast
+from ctypes import addressof, cast
 from enum import IntEnum
 
 from typing_extensions import Annotated
@@ -22,6 +22,11 @@ class PyGC(IntEnum):
     PREV_MASK = uintptr_t(-1).value << PREV_SHIFT
 
 
+# Plain int copies of the flags, IntEnum member lookups and ops are much slower
+_PREV_MASK_FINALIZED = int(PyGC.PREV_MASK_FINALIZED)
+_PREV_MASK = int(PyGC.PREV_MASK)
+
+
 class PyGC_Head(Struct):
     """
     Defines the PyGC_Head Structure.
@@ -41,20 +46,37 @@ class PyGC_Head(Struct):
         return cast(self._gc_next, ptr[PyGC_Head])
 
     def Set_Next(self, item: ptr[PyGC_Head]) -> None:
-        addr = cast(item, c_void_p).value
-        self._gc_next = addr
+        self._gc_next = addressof(item.contents) if item else 0
+
+    def walk_next(self, limit: int | None = None) -> list[int]:
+        """
+        Return the addresses of the PyGC_Head structs following this one.
+
+        Reads _gc_next directly from memory for each node, without creating
+        pointer objects. Stops at a NULL _gc_next, on returning to this struct
+        (GC lists are circular), or after `limit` addresses.
+        """
+        start = addressof(self)
+        read = uintptr_t.from_address
+        addrs = []
+        addr = self._gc_next
+        while addr and addr != start and (limit is None or len(addrs) < limit):
+            addrs.append(addr)
+            addr = read(addr).value
+        return addrs
 
     def Prev(self) -> ptr[PyGC_Head]:
-        return cast(self._gc_prev & PyGC.PREV_MASK, ptr[PyGC_Head])
+        return cast(self._gc_prev & _PREV_MASK, ptr[PyGC_Head])
 
     def Set_Prev(self, item: ptr[PyGC_Head]) -> None:
-        item = cast(item, c_void_p).value
-        if item & ~PyGC.PREV_MASK != 0:
+        addr = addressof(item.contents) if item else 0
+        # The lowest two bits are reserved for flags
+        if addr & ~_PREV_MASK:
             raise ValueError("item is not valid")
-        self._gc_prev = (self._gc_prev & ~PyGC.PREV_MASK) | item
+        self._gc_prev = (self._gc_prev & ~_PREV_MASK) | addr
 
     def Finalized(self) -> bool:
-        return (self._gc_prev & PyGC.PREV_MASK_FINALIZED) != 0
+        return (self._gc_prev & _PREV_MASK_FINALIZED) != 0
 
     def Set_Finalized(self) -> None:
-        self._gc_prev |= PyGC.PREV_MASK_FINALIZED
+        self._gc_prev |= _PREV_MASK_FINALIZED
@@ -1,18 +1,26 @@
 from __future__ import annotations
 
-from ctypes import POINTER, c_long, pythonapi
+from ctypes import POINTER, c_long, c_void_p, cast, pythonapi
+from functools import lru_cache, partial
 from typing import List, TypeVar
 
 from typing_extensions import Annotated
 
+from einspect.api import ARRAY_TYPE_CACHE_SIZE
 from einspect.protocols.delayed_bind import bind_api
 from einspect.structs.py_object import Fields, PyObject, PyVarObject
 from einspect.structs.traits import IsGC
-from einspect.types import ptr
+from einspect.types import Array, ptr
 
 _VT = TypeVar("_VT")
 
 
+@lru_cache(maxsize=ARRAY_TYPE_CACHE_SIZE)
+def _ob_item_type(size: int) -> type:
+    """Return the ob_item display type of a list with ob_size of size."""
+    return ptr[ptr[PyObject] * size]
+
+
 class PyListObject(PyVarObject[list, None, _VT], IsGC):
     """
     Defines a PyListObject Structure.
@@ -34,10 +42,26 @@ class PyListObject(PyVarObject[list, None, _VT], IsGC):
     def _format_fields_(self) -> Fields:
         return {
             **super()._format_fields_(),
-            "ob_item": ("**PyObject", ptr[ptr[PyObject] * self.ob_size]),
+            # The array type is only built if the field is displayed
+            "ob_item": ("**PyObject", partial(_ob_item_type, self.ob_size)),
             "allocated": "c_long",
         }
 
+    def item_addrs(self) -> Array[int]:
+        """
+        Return the ob_item array as an Array of item addresses (c_void_p).
+
+        The Array is a view of the list's memory, not a copy. It supports the
+        buffer protocol, for bulk reads of all item addresses at once.
+        """
+        items_addr = cast(self.ob_item, c_void_p).value or 0
+        return (c_void_p * self.ob_size).from_address(items_addr)
+
+    def items(self) -> list[PyObject[_VT, None, None]]:
+        """Return a list of PyObjects for the items in the list."""
+        from_address = PyObject.from_address
+        return [from_address(addr) for addr in self.item_addrs()]
+
     @bind_api(pythonapi["PyList_GetItem"])
     def GetItem(self, index: int) -> POINTER(PyObject):
         """
@@ -50,6 +74,18 @@ class PyListObject(PyVarObject[list, None, _VT], IsGC):
             pointer[PyObject] (borrowed reference) or pointer[NULL] on failure.
         """
 
+    def GET_ITEM(self, index: int) -> ptr[PyObject]:
+        """
+        Return the object at position index in the list, without error checking.
+
+        Equivalent to the PyList_GET_ITEM macro, a direct read of ob_item[index].
+        The caller must ensure 0 <= index < ob_size.
+
+        Returns:
+            pointer[PyObject] (borrowed reference).
+        """
+        return self.ob_item[index]
+
     @bind_api(pythonapi["PyList_GetSlice"])
     def GetSlice(self, low: int, high: int) -> POINTER(PyListObject):
         """
@@ -1,15 +1,65 @@
 from __future__ import annotations
 
 import ctypes
+import sys
 from collections.abc import Sequence
 from ctypes import addressof, c_uint32, sizeof
+from functools import lru_cache
 
 from typing_extensions import Annotated
 
-from einspect.api import seq_to_array
-from einspect.structs.py_object import Fields, PyVarObject
+from einspect.api import ARRAY_TYPE_CACHE_SIZE, seq_to_array
+from einspect.structs.py_object import Fields, PyVarObject, static_fields
 from einspect.types import Array
 
+PyLong_SHIFT = 30
+"""Number of value bits in each ob_digit."""
+
+_DIGIT_SIZE = sizeof(c_uint32)
+
+# Byte order prefixes of buffer formats that match native digits
+_NATIVE_ORDERS = ("@", "=", "<" if sys.byteorder == "little" else ">")
+
+# Digit counts at or below this are combined with a plain Horner loop
+_HORNER_DIGITS = 64
+
+
+def _digits_to_int(digits: Sequence[int], lo: int, hi: int) -> int:
+    """
+    Combine digits[lo:hi] (least significant first) into an int.
+
+    Large ranges are split in halves and joined with one shift, so the
+    bignum work scales with the result size rather than quadratically.
+    """
+    if hi - lo <= _HORNER_DIGITS:
+        val = 0
+        for i in range(hi - 1, lo - 1, -1):
+            val = (val << PyLong_SHIFT) | digits[i]
+        return val
+    mid = (lo + hi) // 2
+    high = _digits_to_int(digits, mid, hi)
+    return (high << (PyLong_SHIFT * (mid - lo))) | _digits_to_int(digits, lo, mid)
+
+
+def _digit_buffer(value: object) -> memoryview | None:
+    """Return a memoryview of value if it is a contiguous uint32 buffer."""
+    try:
+        mv = memoryview(value)
+    except TypeError:
+        return None
+    fmt = mv.format
+    if fmt[:1] in _NATIVE_ORDERS:
+        fmt = fmt[1:]
+    if fmt in ("I", "L") and mv.itemsize == _DIGIT_SIZE and mv.c_contiguous:
+        return mv
+    return None
+
+
+@lru_cache(maxsize=ARRAY_TYPE_CACHE_SIZE)
+def _digit_array(size: int) -> type[Array[int]]:
+    """Return the ctypes array type of size digits."""
+    return c_uint32 * size
+
 
 class PyLongObject(PyVarObject[int, None, None]):
     """
@@ -20,17 +70,19 @@ class PyLongObject(PyVarObject[int, None, None]):
 
     _ob_digit_0: ctypes.c_uint32 * 0
 
+    @static_fields
     def _format_fields_(self) -> Fields:
         return {**super()._format_fields_(), "ob_digit": "Array[c_uint32]"}
 
     @property
     def mem_size(self) -> int:
         """Return the size of the PyObject in memory."""
-        # Need to add size(uint32) * ob_size to our base size
-        base = super().mem_size
+        # Need to add size(uint32) * ob_size to our base size (the fixed struct size)
+        base = sizeof(self)
         # use size 1 if ob_size is 0 due to allocation
-        size = max(1, abs(self.ob_size))
-        return base + ctypes.sizeof(c_uint32) * size
+        size: int = self.ob_size  # type: ignore
+        size = (-size if size < 0 else size) or 1
+        return base + _DIGIT_SIZE * size
 
     @property
     def ob_digit(self) -> Array[Annotated[int, c_uint32]]:
@@ -39,24 +91,38 @@ class PyLongObject(PyVarObject[int, None, None]):
         # ob_size > 0 means the number is positive
         # ob_size == 0 means the number is zero
         # The true size of the ob_digit array is abs(ob_size)
-        items_addr = ctypes.addressof(self._ob_digit_0)
-        size = max(abs(int(self.ob_size)), 1)
-        return (c_uint32 * size).from_address(items_addr)  # type: ignore
+        items_addr = ctypes.addressof(self) + _OB_DIGIT_OFFSET
+        size: int = self.ob_size  # type: ignore
+        size = (-size if size < 0 else size) or 1
+        return _digit_array(size).from_address(items_addr)  # type: ignore
 
     @ob_digit.setter
     def ob_digit(self, value: Array[int | c_uint32] | Sequence[int]) -> None:
+        # Buffers of native uint32 (e.g. array("I")) are copied directly
+        if not isinstance(value, Array) and (mv := _digit_buffer(value)) is not None:
+            # Count by bytes, as len() is only the first dimension
+            dst = _digit_array(mv.nbytes // _DIGIT_SIZE).from_address(
+                addressof(self) + _OB_DIGIT_OFFSET
+            )
+            memoryview(dst).cast("B")[:] = mv.cast("B")
+            return
+
         arr = seq_to_array(value, c_uint32)
         ctypes.memmove(
-            addressof(self._ob_digit_0),
+            addressof(self) + _OB_DIGIT_OFFSET,
             addressof(arr),
             sizeof(arr),
         )
 
     @property
     def value(self) -> int:
-        if self.ob_size == 0:
-            return 0
-        digit: int  # noqa: F842
-        val = sum(digit * 1 << (30 * i) for i, digit in enumerate(self.ob_digit))
         size: int = self.ob_size  # type: ignore
-        return val * (-1 if size < 0 else 1)
+        if size == 0:
+            return 0
+        digits = self.ob_digit[:]
+        val = _digits_to_int(digits, 0, len(digits))
+        return -val if size < 0 else val
+
+
+# Offset of the variable length ob_digit, to skip creating the empty field array
+_OB_DIGIT_OFFSET: int = PyLongObject._ob_digit_0.offset
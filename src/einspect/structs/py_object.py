@@ -2,12 +2,15 @@
 from __future__ import annotations
 
 import ctypes
+import sys
 import warnings
 from contextlib import suppress
 from ctypes import POINTER, Structure, c_void_p, pythonapi
+from functools import wraps
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     Generic,
     Tuple,
@@ -19,10 +22,9 @@ from typing import (
 
 from typing_extensions import Annotated, Self
 
-from einspect.api import PTR_SIZE, address, align_size
+from einspect.api import PTR_SIZE, PyObj_FromPtr, align_size
 from einspect.compat import Version, python_req
 from einspect.protocols.delayed_bind import bind_api
-from einspect.protocols.type_parse import is_ctypes_type
 from einspect.structs.deco import Struct
 from einspect.structs.py_gc import PyGC_Head
 from einspect.structs.traits import AsRef, IsGC
@@ -31,9 +33,9 @@ from einspect.types import ptr
 if TYPE_CHECKING:
     from einspect.structs import PyTypeObject
 
-__all__ = ("PyObject", "PyVarObject", "Fields", "py_get", "py_set")
+__all__ = ("PyObject", "PyVarObject", "Fields", "static_fields", "py_get", "py_set")
 
-Fields = Dict[str, Union[str, Tuple[str, Type]]]
+Fields = Dict[str, Union[str, Tuple[str, Union[Type, Callable[[], Type]]]]]
 
 _T = TypeVar("_T")
 _KT = TypeVar("_KT")
@@ -42,6 +44,40 @@ _ST = TypeVar("_ST", bound=Structure)
 
 DEFAULT = object()
 
+# Reference counts from here are immortal objects (3.12+), which must not be
+# changed directly. Like _Py_IsImmortal in Include/object.h, on 64-bit builds
+# these have negative low 32 bits as an int32, and on 32-bit builds they are
+# _Py_IMMORTAL_REFCNT (UINT_MAX >> 2).
+if not Version.PY_3_12.above():
+    _IMMORTAL_REFCNT_MIN = sys.maxsize
+elif ctypes.sizeof(ctypes.c_ssize_t) > 4:
+    _IMMORTAL_REFCNT_MIN = 1 << 31
+else:
+    _IMMORTAL_REFCNT_MIN = 0xFFFFFFFF >> 2
+
+_PYGC_HEAD_SIZE = ctypes.sizeof(PyGC_Head)
+
+# Common base of all ctypes instances
+_CData: type = ctypes.c_int.__mro__[-2]
+
+
+def static_fields(func: Callable[[Any], Fields]) -> Callable[[Any], Fields]:
+    """
+    Decorate a _format_fields_ method that does not depend on the instance.
+
+    The fields are built on the first call for each class, then reused.
+    """
+    cache: dict[type, Fields] = {}
+
+    @wraps(func)
+    def wrapper(self) -> Fields:
+        cls = type(self)
+        if (fields := cache.get(cls)) is None:
+            fields = cache[cls] = func(self)
+        return fields
+
+    return wrapper
+
 
 def py_get(obj_ptr: ptr[PyObject]) -> object | None:
     """
@@ -61,7 +97,7 @@ def py_set(obj_ptr: ptr[PyObject], value: object | PyObject | ptr[PyObject]) ->
     """
     # Get and DecRef current
     if obj_ptr:
-        obj_ptr.contents.DecRef()
+        obj_ptr.contents.dec_ref()
     # Set new
     obj_ptr.contents = PyObject.try_from(value).with_ref()
 
@@ -101,8 +137,6 @@ class PyObject(Struct, AsRef, Generic[_T, _KT, _VT]):
             __obj: A Python object to create a PyObject from.
             **kwargs: Fields to create a PyObject from.
         """
-        from einspect.structs.py_type import PyTypeObject
-
         # Base case
         if __obj is DEFAULT and not kwargs:
             return super().__new__(cls)
@@ -116,6 +150,8 @@ class PyObject(Struct, AsRef, Generic[_T, _KT, _VT]):
         if "ob_type" not in kwargs:
             raise TypeError("Missing required keyword-argument field 'ob_type'")
 
+        from einspect.structs.py_type import PyTypeObject
+
         new_ob_size = kwargs.get("ob_size", 0).__index__()
         new_ob_type = PyTypeObject.try_from(kwargs["ob_type"])
 
@@ -134,21 +170,21 @@ class PyObject(Struct, AsRef, Generic[_T, _KT, _VT]):
 
         return res.contents.astype(cls)
 
-    @property
-    def mem_size(self) -> int:
-        """Return the size of the PyObject in memory."""
-        return ctypes.sizeof(self)
-
-    @property
-    def address(self) -> int:
-        """Return the address of the PyObject."""
-        return ctypes.addressof(self)
+    # Properties use the ctypes builtins directly as getters, which avoids a
+    # Python frame per access without caching anything on the instance.
+    mem_size = property(ctypes.sizeof, doc="Return the size of the PyObject in memory.")
+    address = property(ctypes.addressof, doc="Return the address of the PyObject.")
 
     def __eq__(self, other: Self | object) -> bool:
         """Return True if equal in address to another PyObject or object."""
+        if self is other:
+            return True
         if not isinstance(other, PyObject):
-            return self.address == address(other)
-        return self.address == other.address
+            return ctypes.addressof(self) == id(other)
+        return ctypes.addressof(self) == ctypes.addressof(other)
+
+    # Equal to the viewed object as well, whose hash can't be matched
+    __hash__ = None
 
     def __repr__(self) -> str:
         """Return a string representation of the PyObject."""
@@ -172,35 +208,37 @@ class PyObject(Struct, AsRef, Generic[_T, _KT, _VT]):
     @classmethod
     def from_object(cls, obj: _T) -> Self:
         """Create a PyObject from an object."""
-        return cls.from_address(address(obj))
+        # id() is the object address in CPython, without a py_object round-trip
+        return cls.from_address(id(obj))
 
     @classmethod
     def from_gc(cls, gc: PyGC_Head) -> Self:
         """Create a PyObject from a PyGC_Head struct."""
-        addr = ctypes.addressof(gc) + ctypes.sizeof(PyGC_Head)
+        addr = ctypes.addressof(gc) + _PYGC_HEAD_SIZE
         return cls.from_address(addr)
 
     @classmethod
     def try_from(cls, obj_or_ptr: PyObject | ptr[PyObject] | object) -> Self:
         """Create a PyObject from a PyObject, pointer to a PyObject, or object."""
+        # Views first, reusing the address without making an object
+        if isinstance(obj_or_ptr, PyObject):
+            return cls.from_address(ctypes.addressof(obj_or_ptr))
         # noinspection PyUnresolvedReferences
         if isinstance(obj_or_ptr, ctypes._Pointer):
             obj = obj_or_ptr.contents
+            if isinstance(obj, PyObject):
+                return cls.from_address(ctypes.addressof(obj))
         else:
             obj = obj_or_ptr
-        # For ctypes types
-        if is_ctypes_type(type(obj)):
-            if isinstance(obj, PyObject):
-                return cls.from_object(obj.into_object())
-            # raise if not a PyObject
+        # raise for other ctypes instances
+        if isinstance(obj, _CData):
             raise TypeError(f"Cannot create PyObject from {obj_or_ptr!r}")
         # For Python objects
         return cls.from_object(obj)
 
     def into_object(self) -> _T:
         """Cast the PyObject into a Python object."""
-        py_obj = ctypes.cast(self.as_ref(), ctypes.py_object)
-        return py_obj.value
+        return PyObj_FromPtr(ctypes.addressof(self))
 
     def astype(self, dtype: Type[_ST]) -> _ST:
         """Cast the PyObject into another PyObject type."""
@@ -208,9 +246,24 @@ class PyObject(Struct, AsRef, Generic[_T, _KT, _VT]):
 
     def with_ref(self, n: int = 1) -> Self:
         """Increment the reference count of the PyObject by n. Return self."""
-        self.ob_refcnt += n
+        # Immortal objects keep their refcount, like Py_INCREF
+        if (refcnt := self.ob_refcnt) < _IMMORTAL_REFCNT_MIN:
+            self.ob_refcnt = refcnt + n
         return self
 
+    def dec_ref(self) -> None:
+        """
+        Decrement the reference count of the PyObject.
+
+        The count is written directly, unless this would release the last
+        reference or the object is immortal, where Py_DecRef is called instead.
+        """
+        refcnt = self.ob_refcnt
+        if 1 < refcnt < _IMMORTAL_REFCNT_MIN:
+            self.ob_refcnt = refcnt - 1
+        else:
+            self.DecRef()
+
     def is_gc(self) -> bool:
         """
         Returns True if the object implements the GC protocol.
@@ -225,7 +278,7 @@ class PyObject(Struct, AsRef, Generic[_T, _KT, _VT]):
 
     def as_gc(self) -> PyGC_Head:
         """Return the PyGC_Head struct of this object."""
-        addr = self.address - ctypes.sizeof(PyGC_Head)
+        addr = self.address - _PYGC_HEAD_SIZE
         return PyGC_Head.from_address(addr)  # type: ignore
 
     def gc_is_tracked(self) -> bool:
@@ -241,7 +294,8 @@ class PyObject(Struct, AsRef, Generic[_T, _KT, _VT]):
         """
         if not self.is_gc():
             return False
-        if self.ob_type.contents.into_object() is tuple:
+        # Compare the type address, without making the type object
+        if self.ob_type.contents.address == id(tuple):
             return self.gc_is_tracked()
         return True
 
@@ -255,16 +309,17 @@ class PyObject(Struct, AsRef, Generic[_T, _KT, _VT]):
         https://docs.python.org/3/c-api/typeobj.html#c.PyTypeObject.tp_dictoffset
         """
         # Get the tp_dictoffset of the type
-        offset = self.ob_type.contents.tp_dictoffset
+        type_obj = self.ob_type.contents
+        offset = type_obj.tp_dictoffset
         # If 0, the type does not have a dict
         if offset == 0:
             return None
         # For -1, the type uses the 3.12 Managed Dict feature
         if offset == -1:
             # Check that the flag is set
-            from einspect.structs import TpFlags
+            from einspect.structs.include.object_h import TP_FLAGS
 
-            if not self.ob_type.contents.tp_flags & TpFlags.MANAGED_DICT:
+            if not type_obj.tp_flags & TP_FLAGS.MANAGED_DICT:
                 raise RuntimeError(
                     "type has a __dictoffset__ of -1, but tp_flags does not have TpFlags.MANAGED_DICT"
                 )
@@ -278,7 +333,7 @@ class PyObject(Struct, AsRef, Generic[_T, _KT, _VT]):
         else:
             # If not a PyVarObject, use __basic_size__ instead
             if getattr(self, "ob_size", None) is None:
-                size = self.ob_type.contents.tp_basicsize
+                size = type_obj.tp_basicsize
             else:
                 size = align_size(self.mem_size, PTR_SIZE)
                 # Increase size by pointer size since mem_size at this point
@@ -328,7 +383,9 @@ def _PyObject__init__(self, *args, **kwargs) -> None:
             "Positional arguments to PyObject.__init__ are not supported, use keywords instead.",
             UserWarning,
         )
-    return orig_init(self, **kwargs)  # type: ignore
+    # Fields are only set from keywords, skip the Structure init otherwise
+    if kwargs:
+        orig_init(self, **kwargs)  # type: ignore
 
 
 PyObject.__init__ = _PyObject__init__
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+from ctypes import addressof, c_char, sizeof
 from typing import Generic, TypeVar
 
 from typing_extensions import Annotated
 
-from einspect.api import Py_hash_t
+from einspect.api import PTR_SIZE, Py_hash_t
 from einspect.structs.deco import Struct
 from einspect.structs.py_object import Fields, PyObject
 from einspect.structs.traits import IsGC
@@ -28,6 +29,11 @@ class SetEntry(Struct, Generic[_T]):
         }
 
 
+_ENTRY_SIZE = sizeof(SetEntry)
+_KEY_OFFSET: int = SetEntry.key.offset
+_HASH_OFFSET: int = SetEntry.hash.offset
+
+
 class PySetObject(PyObject[set, None, _T], IsGC):
     """
     Defines a PySetObject Structure.
@@ -64,3 +70,20 @@ class PySetObject(PyObject[set, None, _T], IsGC):
     @classmethod
     def from_object(cls, obj: set[_T]) -> PySetObject[_T]:
         return cls.from_address(id(obj))
+
+    def table_views(self) -> tuple[memoryview, memoryview]:
+        """
+        Return (keys, hashes) memoryviews over the entries of the hash table.
+
+        The views are strided over the table memory, not copies. keys holds the
+        entry key addresses (0 for unused slots) and hashes the entry hashes,
+        so the table can be scanned without creating a SetEntry per slot.
+        Deleted slots keep the address of the dummy key.
+        """
+        size = self.mask + 1
+        table = addressof(self.table.contents) if self.table else 0
+        buf = memoryview((c_char * (size * _ENTRY_SIZE)).from_address(table)).cast("B")
+        step = _ENTRY_SIZE // PTR_SIZE
+        keys = buf.cast("P")[_KEY_OFFSET // PTR_SIZE :: step]
+        hashes = buf.cast("n")[_HASH_OFFSET // PTR_SIZE :: step]
+        return keys, hashes
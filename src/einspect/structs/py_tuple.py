@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import ctypes
 from collections.abc import Sequence
-from ctypes import POINTER, pointer, pythonapi, sizeof
+from ctypes import POINTER, c_char, cast, pointer, pythonapi, sizeof
+from functools import lru_cache
 from typing import Any, TypeVar, overload
 
-from einspect.api import Py_ssize_t, seq_to_array
+from einspect.api import ARRAY_TYPE_CACHE_SIZE, PTR_SIZE, seq_to_array
 from einspect.protocols.delayed_bind import bind_api
 from einspect.structs.py_object import Fields, PyObject, PyVarObject
 from einspect.structs.traits import IsGC
@@ -13,6 +14,17 @@ from einspect.types import Array, ptr
 
 _VT = TypeVar("_VT")
 
+# ob_item holds PyObject pointers
+_ITEM_SIZE = PTR_SIZE
+
+_PyObject_pp = POINTER(POINTER(PyObject))
+
+
+@lru_cache(maxsize=ARRAY_TYPE_CACHE_SIZE)
+def _ptr_array(size: int) -> type[Array[ptr[PyObject]]]:
+    """Return the ctypes array type of size PyObject pointers."""
+    return POINTER(PyObject) * size
+
 
 class PyTupleObject(PyVarObject[tuple, None, _VT], IsGC):
     """
@@ -49,24 +61,43 @@ class PyTupleObject(PyVarObject[tuple, None, _VT], IsGC):
     @property
     def mem_size(self) -> int:
         """Return the size of the PyObject in memory."""
-        # Need to add size * ob_size to our base size
-        base = super().mem_size
-        int_size = ctypes.sizeof(Py_ssize_t)
-        return base + (int_size * self.ob_size)
+        # Need to add size * ob_size to our base size (the fixed struct size)
+        return ctypes.sizeof(self) + (_ITEM_SIZE * self.ob_size)
 
     @property
     def ob_item(self) -> Array[ptr[PyObject]]:
         """Return the ob_item field."""
-        items_addr = ctypes.addressof(self._ob_item_0)
-        arr = POINTER(PyObject) * self.ob_size
-        return arr.from_address(items_addr)
+        items_addr = ctypes.addressof(self) + _OB_ITEM_OFFSET
+        return _ptr_array(self.ob_size).from_address(items_addr)
 
     @ob_item.setter
     def ob_item(self, value: Array[ptr[PyObject]] | Sequence[ptr[PyObject]]) -> None:
         """Set the ob_item field."""
-        arr = seq_to_array(value, ptr[PyObject])
-        items_addr = ctypes.addressof(self._ob_item_0)
-        ctypes.memmove(items_addr, arr, sizeof(arr))
+        items_addr = ctypes.addressof(self) + _OB_ITEM_OFFSET
+        # ctypes arrays are copied as is, sequences are converted to one first
+        if not isinstance(value, ctypes.Array):
+            value = seq_to_array(value, ptr[PyObject])
+        ctypes.memmove(items_addr, ctypes.addressof(value), sizeof(value))
+
+    def ob_item_view(self) -> memoryview:
+        """
+        Return a memoryview of the ob_item addresses.
+
+        The view is over the tuple's memory, not a copy, and skips creating a
+        ctypes array type and pointer objects. Items are PyObject addresses.
+        """
+        size = _ITEM_SIZE * self.ob_size
+        buf = (c_char * size).from_address(ctypes.addressof(self) + _OB_ITEM_OFFSET)
+        return memoryview(buf).cast("B").cast("P")
+
+    def items_ptr(self) -> ptr[ptr[PyObject]]:
+        """
+        Return a pointer to the first item, like &PyTuple_GET_ITEM(op, 0).
+
+        Indexing it reads the item pointers directly, without a C API call per
+        item. Items are borrowed references, and indexes are not bounds checked.
+        """
+        return cast(ctypes.addressof(self) + _OB_ITEM_OFFSET, _PyObject_pp)
 
     @bind_api(pythonapi["PyTuple_GetItem"])
     def GetItem(self, index: int) -> pointer[PyObject[_VT, None, None]]:
@@ -87,3 +118,7 @@ class PyTupleObject(PyVarObject[tuple, None, _VT], IsGC):
     @bind_api(pythonapi["_PyTuple_Resize"])
     def Resize(self, size: int) -> None:
         """Resize the tuple to the given size."""
+
+
+# Offset of the variable length ob_item, to skip creating the empty field array
+_OB_ITEM_OFFSET: int = PyTupleObject._ob_item_0.offset
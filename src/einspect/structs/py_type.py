@@ -6,14 +6,17 @@ from ctypes import (
     addressof,
     c_char,
     c_char_p,
+    c_ssize_t,
     c_uint,
     c_ulong,
     cast,
     pointer,
     py_object,
     pythonapi,
+    sizeof,
 )
-from typing import Any, Type, TypeVar
+from types import MappingProxyType
+from typing import Any, Mapping, Type, TypeVar
 
 from typing_extensions import Annotated, Self
 
@@ -31,6 +34,11 @@ _T = TypeVar("_T")
 
 DEFAULT = object()
 
+# ctypes caches pointer types, so fields of ptr[PyObject] are this same type
+_PyObject_p = POINTER(PyObject)
+# Field assignment copies the pointer value, so one NULL instance can be shared
+_PyObject_p_NULL = _PyObject_p()
+
 
 # noinspection PyPep8Naming
 class PyTypeObject(PyVarObject[_T, None, None]):
@@ -136,6 +144,9 @@ class PyTypeObject(PyVarObject[_T, None, None]):
             __obj: A Python object to create a PyTypeObject from.
             **kwargs: Fields to create a PyObject from.
         """
+        # Common case of a type object
+        if isinstance(__obj, type):
+            return cls.from_address(id(__obj))
         if __obj is not DEFAULT:
             # If already a PyObject
             if isinstance(__obj, PyObject):
@@ -164,20 +175,18 @@ class PyTypeObject(PyVarObject[_T, None, None]):
             return
 
         # Get PyMethods pointer, if null, error
-        if slot.ptr_type and not getattr(self, slot.parts[0]):
+        if slot.ptr_type and not getattr(self, slot.owner_attr):
             raise TypeError(
-                f"PyTypeObject {self} has no allocated {slot.ptr_type} {slot.parts[0]!r}"
+                f"PyTypeObject {self} has no allocated {slot.ptr_type} {slot.owner_attr!r}"
             )
 
-        # Get type as element 1 of the field tuple
-        if field := self._fields_map_.get(slot.name):
-            field_type = field[1]
-            # For c_char_p types, set encoded bytes
-            if field_type is c_char_p:
-                return setattr(self, slot.name, value.encode("utf-8"))
-            # For ptr[PyObject] types, set PyObject pointer
-            elif field_type == POINTER(PyObject):
-                return setattr(self, slot.name, PyObject.from_object(value).as_ref())
+        field_type = type_object_fields.get(slot.name)
+        # For c_char_p types, set encoded bytes
+        if field_type is c_char_p:
+            return setattr(self, slot.name, value.encode("utf-8"))
+        # For ptr[PyObject] types, set PyObject pointer
+        elif field_type is _PyObject_p:
+            return setattr(self, slot.name, PyObject.from_object(value).as_ref())
 
         # If not a recognized slot, set with PyObject_SetAttr api
         self.SetAttr(name, value)
@@ -200,25 +209,23 @@ class PyTypeObject(PyVarObject[_T, None, None]):
         # Slot is in a PyMethods sub-struct
         if slot.ptr_type:
             # Get PyMethods pointer, if null, we don't have to delete anything
-            if not (method_ptr := getattr(self, slot.parts[0])):
+            if not (method_ptr := getattr(self, slot.owner_attr)):
                 return
             # Set slot function pointer on PyMethods to null
             method = method_ptr.contents
-            setattr(method, slot.parts[1], NULL)
+            setattr(method, slot.sub_attr, NULL)
             self._try_del_tp_dict(name)
             return
 
-        # Get type as element 1 of the field tuple
-        field = self._fields_map_.get(slot.name)
-        field_type = field[1]
+        field_type = type_object_fields.get(slot.name)
 
         # Overrides
         # For c_char_p types, set encoded bytes
         if field_type is c_char_p:
             setattr(self, slot.name, b"")
         # For ptr[PyObject] types, set PyObject pointer
-        elif field_type == POINTER(PyObject):
-            setattr(self, slot.name, POINTER(PyObject)())
+        elif field_type is _PyObject_p:
+            setattr(self, slot.name, _PyObject_p_NULL)
         # Otherwise, set to null
         setattr(self, slot.name, NULL)
 
@@ -232,7 +239,7 @@ class PyTypeObject(PyVarObject[_T, None, None]):
         https://docs.python.org/3/c-api/type.html#c.PyType_IS_GC
         https://github.com/python/cpython/blob/3.11/Include/objimpl.h#L160-L161
         """
-        return bool(self.tp_flags & TpFlags.HAVE_GC)
+        return bool(self.tp_flags & TP_FLAGS.HAVE_GC)
 
     @bind_api(pythonapi["PyType_Ready"])
     def Ready(self) -> int:
@@ -259,18 +266,33 @@ class PyTypeObject(PyVarObject[_T, None, None]):
         """Create a new variable object of the type with GC support."""
 
 
-# Mapping of CField name to type
+# Read-only mapping of CField name to type, used for slot field lookups
 # noinspection PyProtectedMember
-type_object_fields = {name: t for name, t, *_ in PyTypeObject._fields_}
+type_object_fields: Mapping[str, type] = MappingProxyType(
+    {name: t for name, t, *_ in PyTypeObject._fields_}
+)
+
+
+# Offset of the proto (field type) pointer in a ctypes CField object,
+# after the object header and its offset, size and index fields.
+_CFIELD_PROTO_OFFSET = object.__basicsize__ + sizeof(c_ssize_t) * 3
 
 
 # Patch PyTypeObject back into PyObject
 def _patch_py_object():
+    # _fields_ is final once the Structure is created, so the CField type is
+    # written in place rather than rebuilding PyObject
     # noinspection PyProtectedMember
     fields = PyObject._fields_
     fields[1] = ("ob_type", POINTER(PyTypeObject))
-    offset = object.__basicsize__ + tuple.__itemsize__ * 3
-    py_object.from_address(id(PyObject.ob_type) + offset).value = POINTER(PyTypeObject)
+    proto_addr = id(PyObject.ob_type) + _CFIELD_PROTO_OFFSET
+    py_object.from_address(proto_addr).value = POINTER(PyTypeObject)
+    # Field maps of classes created before the patch still hold the old entry
+    pending = [PyObject]
+    while pending:
+        cls = pending.pop()
+        cls._fields_map_["ob_type"] = fields[1]
+        pending.extend(cls.__subclasses__())
 
 
 _patch_py_object()
@@ -321,7 +343,7 @@ class TypeNewWrapper:
         # Semantically, this is the same as the original check.
         # Also bypass this check if the type is a heap type, and _type is object / type.
         if staticbase and (staticbase_obj := staticbase[0]):
-            if (staticbase_obj.tp_flags & TpFlags.HEAPTYPE) and (
+            if (staticbase_obj.tp_flags & TP_FLAGS.HEAPTYPE) and (
                 self._type is object or self._type is type
             ):
                 staticbase_obj = None
@@ -2,7 +2,8 @@
 # https://docs.python.org/3/c-api/typeobj.html
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from typing import Final, Sequence, Union
 
 from einspect.structs.include.object_h import (
@@ -13,14 +14,21 @@ from einspect.structs.include.object_h import (
 )
 
 
-@dataclass
+@dataclass(frozen=True)
 class Slot:
     name: str
     ptr_type: type | None = None
-
-    @property
-    def parts(self) -> list[str]:
-        return self.name.split(".")
+    # Parts of name, like ("tp_as_number", "nb_add") for "tp_as_number.nb_add"
+    parts: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    owner_attr: str = field(init=False, repr=False, compare=False)
+    sub_attr: str | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Parts are used as attribute names, interning them speeds up lookups
+        parts = tuple(map(sys.intern, self.name.split(".")))
+        object.__setattr__(self, "parts", parts)
+        object.__setattr__(self, "owner_attr", parts[0])
+        object.__setattr__(self, "sub_attr", parts[1] if len(parts) > 1 else None)
 
     def __getitem__(self, slot: str | Slot):
         slot_name = slot.name if isinstance(slot, Slot) else slot
@@ -141,13 +149,15 @@ SLOTS_MAPPING: Final[dict[str, SlotsLike]] = {
 }
 
 # Set of all dunder slot names
-SLOTS_NAMES: set[str] = {
-    *SLOTS_MAIN.keys(),
-    *SLOTS_SUB_ASYNC.keys(),
-    *SLOTS_NUMBERS.keys(),
-    *SLOTS_SEQUENCE.keys(),
-    *SLOTS_MAPPING.keys(),
-}
+SLOTS_NAMES: frozenset[str] = frozenset(
+    {
+        *SLOTS_MAIN.keys(),
+        *SLOTS_SUB_ASYNC.keys(),
+        *SLOTS_NUMBERS.keys(),
+        *SLOTS_SEQUENCE.keys(),
+        *SLOTS_MAPPING.keys(),
+    }
+)
 
 SLOTS = [
     SLOTS_MAIN,
@@ -158,22 +168,33 @@ SLOTS = [
 ]
 
 
-def get_slot(name: str, prefer: str | None = None) -> Slot | None:
-    # Filter out slots that conflict with preferred
-    slots_ls = SLOTS
-    if prefer == "sequence":
-        # Prefer sequence to mapping
-        slots_ls = [s for s in SLOTS if s is not SLOTS_MAPPING]
-    elif prefer == "mapping":
-        # Prefer mapping to sequence
-        slots_ls = [s for s in SLOTS if s is not SLOTS_SEQUENCE]
-
-    # Iterate the list to find matches
+def _slots_index(slots_ls: list[dict[str, SlotsLike]]) -> dict[str, SlotsLike]:
+    """Merge slot maps into one, with earlier maps taking priority."""
+    index = {}
     for slots_map in slots_ls:
-        if name in slots_map:
-            res = slots_map[name]
+        for name, res in slots_map.items():
             # Make a Slot if we got a str
-            if isinstance(res, str):
-                return Slot(res)
-            return res
-    return None
+            index.setdefault(name, Slot(res) if isinstance(res, str) else res)
+    return index
+
+
+# Merged slot maps by get_slot prefer option, results are shared between callers
+_SLOTS_INDEX: dict[str | None, dict[str, SlotsLike]] = {
+    None: _slots_index(SLOTS),
+    # Prefer sequence to mapping
+    "sequence": _slots_index([s for s in SLOTS if s is not SLOTS_MAPPING]),
+    # Prefer mapping to sequence
+    "mapping": _slots_index([s for s in SLOTS if s is not SLOTS_SEQUENCE]),
+}
+
+
+def get_slot(name: str, prefer: str | None = None) -> Slot | None:
+    """
+    Return the Slot of a dunder name, or None if it is not a slot.
+
+    Names in several slot maps resolve in the order of SLOTS (main, async,
+    number, sequence, mapping). A prefer of "sequence" or "mapping" excludes
+    the other of the two.
+    """
+    index = _SLOTS_INDEX.get(prefer) or _SLOTS_INDEX[None]
+    return index.get(name)
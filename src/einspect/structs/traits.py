@@ -1,4 +1,9 @@
-"""Traits and mixins for structs."""
+"""
+Traits and mixins for structs.
+
+Mixins must define empty `__slots__`, so they don't add instance
+layout to the Structure subclasses they are combined with.
+"""
 from ctypes import Structure, addressof, pointer
 
 from typing_extensions import Self
@@ -9,6 +14,8 @@ from einspect.types import ptr
 class AsRef:
     """Mixin for an as_ref method."""
 
+    __slots__ = ()
+
     def as_ref(self) -> ptr[Self]:
         """Return a pointer to the Structure."""
         return pointer(self)  # type: ignore
@@ -17,6 +24,8 @@ class AsRef:
 class Display:
     """Mixin for displaying Structures."""
 
+    __slots__ = ()
+
     def __repr__(self: Structure) -> str:
         """
         Return a string representation of the Structure.
@@ -28,4 +37,6 @@ class Display:
 class IsGC:
     """Mixin for Structures that have a GC_Head."""
 
+    __slots__ = ()
+
     _is_gc_ = True
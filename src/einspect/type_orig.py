@@ -14,9 +14,16 @@ _T = TypeVar("_T")
 # Singleton to cache for attributes that don't exist on the type
 MISSING = object()
 
+# Sentinel for cache misses, as MISSING is a valid cached value
+_NOT_CACHED = object()
+
+# Stand-in for types not in cache, lookups don't create entries (only add_cache)
+_EMPTY: dict[str, Any] = {}
+
 # Statically cache some methods used in cache lookups
 obj_tp_new = cast(PyTypeObject.from_object(object).tp_new, newfunc)
 obj_getattr = object.__getattribute__
+obj_setattr = object.__setattr__
 type_hash = type.__hash__
 str_eq = str.__eq__
 
@@ -28,7 +35,6 @@ dict_get = dict.get
 
 set_contains = set.__contains__
 
-wk_dict_setdefault = WeakKeyDictionary.setdefault
 wk_dict_getitem = WeakKeyDictionary.__getitem__
 wk_dict_get = WeakKeyDictionary.get
 
@@ -39,7 +45,9 @@ _impls: WeakKeyDictionary[type, set[str]] = WeakKeyDictionary()
 
 def add_cache(type_: type, name: str, method: Any, overwrite: bool = False) -> Any:
     """Add a type's attribute to the cache."""
-    type_attrs = wk_dict_setdefault(_cache, type_, {})
+    # Get or create the type's attributes, without a new dict on every call
+    if (type_attrs := wk_dict_get(_cache, type_)) is None:
+        type_attrs = _cache[type_] = {}
 
     # For `__new__` methods, use special TypeNewWrapper for modified safety check
     if name == "__new__":
@@ -62,7 +70,8 @@ def add_cache(type_: type, name: str, method: Any, overwrite: bool = False) -> A
 
 def add_impls(type_: type, *attrs: str) -> None:
     """Add a set of implemented attributes to the cache."""
-    attrs_set = wk_dict_setdefault(_impls, type_, set())
+    if (attrs_set := wk_dict_get(_impls, type_)) is None:
+        attrs_set = _impls[type_] = set()
     attrs_set.update(attrs)
 
 
@@ -110,8 +119,7 @@ def try_cache_attr(
 
 def in_cache(type_: type, name: str) -> bool:
     """Return True if the method is in the cache."""
-    type_methods = wk_dict_setdefault(_cache, type_, {})
-    return dict_contains(type_methods, name)
+    return dict_contains(wk_dict_get(_cache, type_, _EMPTY), name)
 
 
 def in_impls(type_: type, name: str) -> bool:
@@ -122,7 +130,7 @@ def in_impls(type_: type, name: str) -> bool:
 
 def get_cache(type_: type, name: str) -> Any:
     """Get the method from the type in cache."""
-    type_methods = wk_dict_setdefault(_cache, type_, {})
+    type_methods = wk_dict_get(_cache, type_, _EMPTY)
     try:
         return dict_getitem(type_methods, name)
     except KeyError:
@@ -170,11 +178,17 @@ class orig:
     on the type before modification by @impl or TypeView.
     """
 
+    __slots__ = ("__type", "__attrs")
+
     def __new__(cls, type_: Type[_T]) -> Type[_T]:
         # To avoid a circular call loop when orig is called within
         # impl of object.__new__, we use the raw tp_new of object here.
         self = obj_tp_new(cls, (), {})
         self.__type = type_
+        # Cache entries are never replaced, so keep the type's dict to skip
+        # the weakref lookup of _cache on each access. None until one exists,
+        # as creating an orig does not add a cache entry.
+        self.__attrs = wk_dict_get(_cache, type_)
         return self  # type: ignore
 
     def __repr__(self) -> str:
@@ -186,16 +200,22 @@ class orig:
 
     def __getattribute__(self, name: str):
         """Get an attribute from the original type."""
+        # Check if the attribute is cached
+        if (attrs := obj_getattr(self, "_orig__attrs")) is None:
+            attrs = wk_dict_get(_cache, obj_getattr(self, "_orig__type"))
+            if attrs is None:
+                attrs = _EMPTY
+            else:
+                obj_setattr(self, "_orig__attrs", attrs)
+        attr = dict_get(attrs, name, _NOT_CACHED)
+        if attr is not _NOT_CACHED:
+            return attr
+
         # Overrides
         _type = obj_getattr(self, "_orig__type")
         if str_eq(name, "_orig__type"):
             return _type
 
-        # Check if the attribute is cached
-        try:
-            return get_cache(_type, name)
-        except KeyError:
-            pass
         # Get the attribute from the original type and cache it
         attr = getattr(_type, name)
         return add_cache(_type, name, attr)
@@ -5,6 +5,7 @@ import typing
 
 # noinspection PyUnresolvedReferences, PyProtectedMember
 from ctypes import _Pointer
+from functools import lru_cache
 from typing import TYPE_CHECKING, List, TypeVar, get_origin, overload
 
 from typing_extensions import Self
@@ -58,19 +59,25 @@ class _Ptr(_Pointer):
 
     def __class_getitem__(cls, item):
         """Return a `ctypes.POINTER` of the given type."""
-        # For ptr[Self], return a special object
-        if item is Self:
-            return _SelfPtr
-
-        # Get base of generic alias
-        # noinspection PyUnresolvedReferences, PyProtectedMember
-        if isinstance(item, typing._GenericAlias):
-            item = get_origin(item)
-
-        try:
-            return ctypes.POINTER(item)
-        except TypeError as e:
-            raise TypeError(f"{e} (During POINTER({item}))") from e
+        return _pointer_type(item)
+
+
+@lru_cache(maxsize=None)
+def _pointer_type(item):
+    """Return a `ctypes.POINTER` of the given type, cached by item."""
+    # For ptr[Self], return a special object
+    if item is Self:
+        return _SelfPtr
+
+    # Get base of generic alias
+    # noinspection PyUnresolvedReferences, PyProtectedMember
+    if isinstance(item, typing._GenericAlias):
+        item = get_origin(item)
+
+    try:
+        return ctypes.POINTER(item)
+    except TypeError as e:
+        raise TypeError(f"{e} (During POINTER({item}))") from e
 
 
 if Version.PY_3_9.above():  # pragma: no cover
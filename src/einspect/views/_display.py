@@ -4,7 +4,7 @@ from __future__ import annotations
 import ctypes
 from ctypes import Array, Structure, cast
 from string import Template
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable
 
 from einspect.structs.py_object import PyObject
 
@@ -85,13 +85,16 @@ class Formatter:
         self,
         struct: PyObject,
         attr: str,
-        hint: str | tuple[str, type],
+        hint: str | tuple[str, type | Callable[[], type]],
         type_hints: bool | None = None,
     ) -> str:
         value = getattr(struct, attr)
         type_cast = None
         if isinstance(hint, tuple):
             hint, type_cast = hint
+            # Cast types may be deferred until display
+            if not isinstance(type_cast, type):
+                type_cast = type_cast()
 
         use_hints = self.types if type_hints is None else type_hints
         type_str = f": {hint}" if use_hints else ""
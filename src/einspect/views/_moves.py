@@ -6,7 +6,8 @@ from typing import TYPE_CHECKING
 
 from einspect.api import PTR_SIZE
 from einspect.errors import UnsafeError
-from einspect.structs import PyASCIIObject, PyObject, TpFlags
+from einspect.structs import PyASCIIObject, PyObject
+from einspect.structs.include.object_h import TP_FLAGS
 
 if TYPE_CHECKING:
     from einspect.views.view_base import View
@@ -32,7 +33,7 @@ def check_move(dst: View, src: View) -> None:
     # Check if dst has an instance dict
     if (dst_dict := dst._pyobject.instance_dict()) is not None:
         # Set -1 to if managed dict
-        if dst._pyobject.ob_type.contents.tp_flags & TpFlags.MANAGED_DICT:
+        if dst._pyobject.ob_type.contents.tp_flags & TP_FLAGS.MANAGED_DICT:
             dst_offset = -1
         else:
             # If offset is positive, add this to dst_allocated
@@ -44,7 +45,7 @@ def check_move(dst: View, src: View) -> None:
     if (src_dict := src._pyobject.instance_dict()) is not None:
         # If moving from managed -> managed, always safe
         if not (
-            src._pyobject.ob_type.contents.tp_flags & TpFlags.MANAGED_DICT
+            src._pyobject.ob_type.contents.tp_flags & TP_FLAGS.MANAGED_DICT
             and dst_offset == -1
         ):
             src_offset = addressof(src_dict) - src._pyobject.address
@@ -88,7 +89,7 @@ def move(
         if (src_dict_ptr := src.instance_dict()) is not None:
             dict_addr = addressof(src_dict_ptr)
             # Normally we copy by offset, unless managed dict
-            if not src.ob_type.contents.tp_flags & TpFlags.MANAGED_DICT:
+            if not src.ob_type.contents.tp_flags & TP_FLAGS.MANAGED_DICT:
                 dict_offset = dict_addr - src.address
                 memmove(
                     dst.address + dict_offset,
@@ -107,6 +108,6 @@ def move(
     if (
         inst_dict
         and src_dict_ptr is not None
-        and src.ob_type.contents.tp_flags & TpFlags.MANAGED_DICT
+        and src.ob_type.contents.tp_flags & TP_FLAGS.MANAGED_DICT
     ):
         dst.SetAttr("__dict__", src_dict_ptr.contents.into_object())
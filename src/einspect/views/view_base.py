@@ -20,7 +20,8 @@ from typing import (
 
 from einspect.api import PTR_SIZE, Py, PyObj_FromPtr, align_size
 from einspect.errors import DroppedReference, MovedError, UnsafeError
-from einspect.structs import PyObject, PyTypeObject, PyVarObject, TpFlags
+from einspect.structs import PyObject, PyTypeObject, PyVarObject
+from einspect.structs.include.object_h import TP_FLAGS
 from einspect.views._display import Formatter
 from einspect.views._moves import check_move, move
 from einspect.views.unsafe import UnsafeContext, unsafe
@@ -339,7 +340,7 @@ class View(BaseView[_T, _KT, _VT]):
         # Save the other PyObject type
         other_py_type = type(other._pyobject)
         other_is_managed_dict = (
-            other._pyobject.ob_type.contents.tp_flags & TpFlags.MANAGED_DICT
+            other._pyobject.ob_type.contents.tp_flags & TP_FLAGS.MANAGED_DICT
         )
 
         # Check safety of both moves
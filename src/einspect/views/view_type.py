@@ -12,6 +12,7 @@ from einspect._typing import is_union
 from einspect.compat import Version
 from einspect.errors import UnsafeError
 from einspect.structs import PyDictObject, PyObject, PyTypeObject, TpFlags
+from einspect.structs.include.object_h import TP_FLAGS
 from einspect.structs.slots_map import (
     Slot,
     get_slot,
@@ -198,7 +199,7 @@ def _allocate_methods(obj: PyTypeObject, *slots: Slot, subclasses: bool = True)
         if not slot.ptr_type:
             continue
         # Allocate if the slot is null
-        if not (py_method := getattr(obj, slot.parts[0])):
+        if not (py_method := getattr(obj, slot.owner_attr)):
             new_struct = slot.ptr_type()
             # Need to keep a reference to the PyMethod struct,
             # so it doesn't get garbage collected.
@@ -284,8 +285,8 @@ class TypeView(VarView[_T, None, None]):
     def immutable(self) -> bool:
         """Return True if the type is immutable."""
         if Version.PY_3_10.above():
-            return bool(self._pyobject.tp_flags & TpFlags.IMMUTABLETYPE)
-        return not bool(self._pyobject.tp_flags & TpFlags.HEAPTYPE)  # pragma: no cover
+            return bool(self._pyobject.tp_flags & TP_FLAGS.IMMUTABLETYPE)
+        return not bool(self._pyobject.tp_flags & TP_FLAGS.HEAPTYPE)  # pragma: no cover
 
     @immutable.setter
     def immutable(self, value: bool):
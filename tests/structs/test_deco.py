@@ -1,6 +1,17 @@
-from ctypes import Structure, c_void_p
+from ctypes import (
+    POINTER,
+    Structure,
+    addressof,
+    c_int,
+    c_ssize_t,
+    c_uint8,
+    c_uint32,
+    c_void_p,
+)
 
-from einspect.structs.deco import struct
+from typing_extensions import Annotated
+
+from einspect.structs.deco import Struct, struct
 
 
 def test_struct_deco():
@@ -30,3 +41,64 @@ def test_struct_deco_factory():
     f = Foo()
     assert f.x is None
     assert f.y == 0
+
+
+def test_struct_deco_ctypes_hints():
+    @struct
+    class Bar(Structure):
+        x: c_int
+
+    @struct
+    class Foo(Structure):
+        a: c_int
+        b: POINTER(c_int)
+        c: Bar
+
+    assert Foo._fields_[0] == ("a", c_int)
+    assert Foo._fields_[1] == ("b", POINTER(c_int))
+    # Structure hints are still converted to pointers
+    assert Foo._fields_[2] == ("c", POINTER(Bar))
+
+
+def test_struct_deco_annotated():
+    @struct
+    class Foo(Structure):
+        a: Annotated[int, c_uint8]
+        b: Annotated[int, c_uint32, 4]
+        c: int
+
+    assert Foo._fields_ == [("a", c_uint8), ("b", c_uint32, 4), ("c", c_ssize_t)]
+
+
+def test_struct_fields_map():
+    class Foo(Struct):
+        a: int
+
+    class Bar(Foo):
+        b: int
+
+    assert list(Bar._fields_map_) == ["a", "b"]
+    bar = Bar()
+    bar.b = 5
+    # Field writes use the class level map only
+    assert bar.b == 5
+    assert "_fields_map_" not in vars(bar)
+
+
+def test_struct_snapshot():
+    class Foo(Struct):
+        a: Annotated[int, c_uint8]
+        b: int
+        c: Annotated[int, c_uint32, 4]
+        d: POINTER(c_int)
+        e: c_int * 2
+
+    value = c_int(1)
+    foo = Foo(a=1, b=-2, c=3, d=POINTER(c_int)(value), e=(c_int * 2)(4, 5))
+    snap = foo.snapshot()
+    assert list(snap) == ["a", "b", "d", "e", "c"]
+    assert snap["a"] == 1
+    assert snap["b"] == -2
+    assert snap["c"] == 3
+    assert snap["d"] == addressof(value)
+    assert snap["e"] == bytes(foo.e)
@@ -1,6 +1,10 @@
+from ctypes import addressof, c_char, pointer
+
 import pytest
 
 from einspect.structs import PyObject
+from einspect.structs.py_gc import PyGC_Head
+from einspect.types import NULL
 
 
 def test_from_gc() -> None:
@@ -11,6 +15,15 @@ def test_from_gc() -> None:
     assert PyObject.from_gc(gc_head).into_object() is ls
 
 
+def test_walk_next() -> None:
+    ls = [1, 2, 3]
+    gc_head = PyObject.from_object(ls).as_gc()
+    addrs = gc_head.walk_next(limit=3)
+    assert 0 < len(addrs) <= 3
+    assert addrs[0] == addressof(gc_head.Next().contents)
+    assert gc_head.walk_next(limit=0) == []
+
+
 @pytest.mark.run_in_subprocess
 def test_gc_head_api():
     obj = ["test", "123"]
@@ -19,3 +32,22 @@ def test_gc_head_api():
 
     assert gc_head.Set_Prev(gc_head.Prev()) is None
     assert gc_head.Set_Next(gc_head.Next()) is None
+
+
+def test_gc_head_set_prev() -> None:
+    gc_head = PyGC_Head()
+    gc_head.Set_Finalized()
+    other = PyGC_Head()
+    gc_head.Set_Prev(pointer(other))
+    assert addressof(gc_head.Prev().contents) == addressof(other)
+    # Flag bits are kept
+    assert gc_head.Finalized()
+
+    gc_head.Set_Prev(NULL)
+    assert not gc_head.Prev()
+
+    # Unaligned addresses would overwrite the flag bits
+    buf = (c_char * 32)()
+    unaligned = PyGC_Head.from_address(addressof(buf) + 1)
+    with pytest.raises(ValueError):
+        gc_head.Set_Prev(pointer(unaligned))
@@ -56,3 +56,16 @@ def test_py_object():
     # Set to NULL
     s.tp_dict = NULL
     assert s.tp_dict == NULL
+
+
+def test_ob_type():
+    """Test NULL assignment to ob_type of structs created before its patch."""
+
+    for cls in (PyObject, PyTypeObject):
+        # Copy of the struct, so the live object is not modified
+        obj = cls.from_object(int)
+        s = cls.from_buffer_copy(bytes(obj))
+        assert s.ob_type
+
+        s.ob_type = NULL
+        assert not s.ob_type
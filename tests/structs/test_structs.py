@@ -1,9 +1,12 @@
 import ctypes
+import sys
+from array import array
 from ast import literal_eval
 
 import pytest
 
 from einspect import structs as st
+from einspect.structs.include.object_h import TP_FLAGS
 from einspect.structs.py_gc import PyGC_Head
 from einspect.structs.py_unicode import Kind
 
@@ -22,6 +25,20 @@ class TestPyObject:
         py_obj = st.PyObject.from_object(ls)
         assert repr(py_obj) == f"<PyObject[list] at {id(ls):#04x}>"
 
+    def test_repr_live_type(self):
+        """The type name is read from ob_type on each repr, not at creation."""
+
+        class A:
+            pass
+
+        class B:
+            pass
+
+        obj = A()
+        py_obj = st.PyObject.from_object(obj)
+        obj.__class__ = B
+        assert repr(py_obj) == f"<PyObject[B] at {id(obj):#04x}>"
+
     def test_eq(self):
         """Two PyObjects at same address should be equal."""
         ls = [1, 2]
@@ -29,6 +46,13 @@ class TestPyObject:
         obj_b = st.PyObject.from_object(ls)
         ls_a = st.PyListObject.from_object(ls)
         assert obj_a == obj_b == ls_a
+        assert obj_a == ls
+        assert obj_a != st.PyObject.from_object([1, 2])
+
+    def test_unhashable(self):
+        """PyObjects compare equal to the object, so can't share its hash."""
+        with pytest.raises(TypeError):
+            hash(st.PyObject.from_object([1, 2]))
 
     def test_new_from_object(self):
         ls = []
@@ -36,6 +60,33 @@ class TestPyObject:
         assert py_object.ob_refcnt == 1
         assert py_object.ob_type.contents.into_object() == list
 
+    @pytest.mark.skipif(sys.version_info < (3, 12), reason="PEP 683 immortals")
+    def test_immortal_refcnt(self):
+        py_none = st.PyObject.from_object(None)
+        refcnt = py_none.ob_refcnt
+        py_none.with_ref()
+        py_none.dec_ref()
+        assert py_none.ob_refcnt == refcnt
+
+    def test_no_instance_attrs(self):
+        """Common operations should store nothing on the struct instance."""
+        ls = [1, 2]
+        py_list = st.PyListObject.from_object(ls)
+        py_list.allocated = py_list.allocated
+        assert py_list.GetItem(0).contents.into_object() == 1
+        repr(py_list)
+        py_list._format_fields_()
+        assert vars(py_list) == {}
+
+    def test_dec_ref(self):
+        ls = []
+        py_object = st.PyObject.from_object(ls)
+        py_object.with_ref(2)
+        assert py_object.ob_refcnt == 3
+        py_object.dec_ref()
+        py_object.dec_ref()
+        assert py_object.ob_refcnt == 1
+
     @pytest.mark.parametrize(
         ["obj", "ob_type"],
         [
@@ -115,6 +166,18 @@ class TestPyListObject:
         pylist.ob_item[0] = st.PyObject.from_object(5).as_ref()
         assert ls == [5, 2]
 
+    @pytest.mark.parametrize("ls", [[], [1], ["a", None, 2.5]])
+    def test_item_addrs(self, ls):
+        pylist = st.PyListObject.from_object(ls)
+        assert pylist.item_addrs()[:] == [id(x) for x in ls]
+        assert [obj.into_object() for obj in pylist.items()] == ls
+
+    def test_get_item_macro(self):
+        ls = ["a", None, 2.5]
+        pylist = st.PyListObject.from_object(ls)
+        for i, x in enumerate(ls):
+            assert pylist.GET_ITEM(i).contents.into_object() is x
+
 
 class TestPyDictObject:
     def test_new(self):
@@ -142,8 +205,42 @@ class TestPyDictObject:
         fields = keys._format_fields_()
         assert fields["dk_indices"] == f"Array[{indice_name}]"
 
-        # Check main object format fields
+        # Check main object format fields, which are shared across instances
         assert py_obj._format_fields_()
+        other = st.PyDictObject.from_object({})
+        assert other._format_fields_() is py_obj._format_fields_()
+
+    def test_is_split(self):
+        class Foo:
+            def __init__(self):
+                self.x = 1
+
+        d = {"x": 1}
+        assert not st.PyDictObject.from_object(d).is_split
+        inst_dict = Foo().__dict__
+        assert st.PyDictObject.from_object(inst_dict).is_split
+
+    @pytest.mark.parametrize("size", [1, 200, 1000])
+    def test_dk_indices_view(self, size):
+        d = {i: i for i in range(size)}
+        del d[0]
+        py_dict = st.PyDictObject.from_object(d)
+        keys = py_dict.ma_keys.contents
+        view = keys.dk_indices_view()
+        assert len(view) == keys._dk_size
+        indices = view.tolist()
+        assert sum(i >= 0 for i in indices) == py_dict.ma_used
+        # Deleted key leaves a DKIX_DUMMY
+        assert indices.count(-2) == 1
+
+    def test_known_hash(self):
+        d = {"a": 1}
+        py_dict = st.PyDictObject.from_object(d)
+        assert py_dict.GetItemKnownHash("a", hash("a")).contents.into_object() == 1
+        assert not py_dict.GetItemKnownHash("b", hash("b"))
+
+        assert py_dict.SetItemKnownHash("b", 2, hash("b")) == 0
+        assert d == {"a": 1, "b": 2}
 
 
 class TestPyUnicodeObject:
@@ -160,6 +257,14 @@ class TestPyUnicodeObject:
         assert py_str.kind == kind
         assert py_str.buffer[:] == buffer
 
+    def test_unknown_kind(self):
+        py_str = st.PyUnicodeObject.from_object("\U0001f300")
+        # Copy of the struct, so the live string is not modified
+        py_str = type(py_str).from_buffer_copy(bytes(py_str))
+        py_str.kind = 3
+        with pytest.raises(ValueError):
+            py_str.buffer
+
 
 class TestPyTypeObject:
     def test_new(self):
@@ -178,6 +283,11 @@ class TestPyTypeObject:
         with pytest.raises(TypeError):
             py_int.setattr_safe("__contains__", lambda a, b: True)
 
+    def test_tp_flags_values(self):
+        for name, flag in st.TpFlags.__members__.items():
+            assert getattr(TP_FLAGS, name) == flag
+            assert type(getattr(TP_FLAGS, name)) is int
+
 
 class TestPyLongObject:
     def test_digit(self, new_int):
@@ -191,6 +301,34 @@ class TestPyLongObject:
         # But not Generators, Iterators, etc.
         with pytest.raises(TypeError):
             obj.ob_digit = (i for i in range(5))
+        # uint32 buffers are copied directly
+        obj.ob_digit = array("I", [7])
+        assert py_obj == 7
+
+    def test_digit_buffer_formats(self, new_int):
+        obj = st.PyLongObject.from_object(new_int)
+        py_obj = obj.into_object()
+        # ctypes arrays export native uint32 with an explicit byte order ("<I")
+        obj.ob_digit = memoryview((ctypes.c_uint32 * 1)(9))
+        assert py_obj == 9
+        # Multi-dimensional buffers are copied by bytes, not by len()
+        py_obj = literal_eval(str(2**40))
+        obj = st.PyLongObject.from_object(py_obj)
+        assert obj.ob_size == 2
+        obj.ob_digit = memoryview(array("I", [3, 1])).cast("B").cast("I", [1, 2])
+        assert py_obj == 3 + (1 << 30)
+
+    @pytest.mark.parametrize(
+        "value", [0, 1, -1, 2**30, -(2**60 - 1), 3**500, -(10**400), 7**5000]
+    )
+    def test_value(self, value):
+        obj = st.PyLongObject.from_object(value)
+        assert obj.value == value
+
+    @pytest.mark.parametrize("value", [1, -1, 2**30, -(10**400)])
+    def test_mem_size(self, value):
+        obj = st.PyLongObject.from_object(value)
+        assert obj.mem_size == sys.getsizeof(value)
 
 
 class TestPyTupleObject:
@@ -204,6 +342,28 @@ class TestPyTupleObject:
         obj.ob_item = arr_type(st.PyObject.from_object(5).as_ref())
         assert obj.into_object() == (5,)
 
+    @pytest.mark.parametrize("tup", [(), (1, "a", None)])
+    def test_ob_item_view(self, tup):
+        obj = st.PyTupleObject.from_object(tup)
+        assert obj.ob_item_view().tolist() == [id(x) for x in tup]
+
+    def test_items_ptr(self):
+        tup = ("a", None, 2.5)
+        items = st.PyTupleObject.from_object(tup).items_ptr()
+        for i, x in enumerate(tup):
+            assert items[i].contents.into_object() is x
+
+
+class TestPySetObject:
+    @pytest.mark.parametrize("size", [0, 3, 100])
+    def test_table_views(self, size):
+        items = {f"item{i}" for i in range(size)}
+        py_set = st.PySetObject.from_object(items)
+        keys, hashes = py_set.table_views()
+        assert len(keys) == len(hashes) == py_set.mask + 1
+        used = {k: h for k, h in zip(keys.tolist(), hashes.tolist()) if k}
+        assert used == {id(x): hash(x) for x in items}
+
 
 @pytest.mark.parametrize(
     ["obj", "struct", "size"],
@@ -1,6 +1,9 @@
+import ctypes
+
 import pytest
 
-from einspect.protocols.delayed_bind import bind_api, delayed_bind
+from einspect.protocols.delayed_bind import bind_api, bound_api, delayed_bind
+from einspect.structs import PyListObject
 
 
 def test_no_types():
@@ -23,13 +26,42 @@ def test_repr():
         assert repr(bar) == "<delayed_bind property None>"
 
 
-def test_not_support_slots():
+def test_slots():
     class Foo:
         __slots__ = ()
 
-        @bind_api(lambda: None)
-        def bar(self) -> int:
+        @bind_api(ctypes.pythonapi["PyObject_Hash"])
+        def bar(self: object) -> int:
             pass
 
-    with pytest.raises(TypeError):
-        assert not Foo().bar()
+    foo = Foo()
+    assert foo.bar() == hash(foo)
+
+
+def test_class_install():
+    ls = [1, 2]
+    py_list = PyListObject.from_object(ls)
+    assert py_list.GetItem(1).contents.into_object() == 2
+    # After first access, the descriptor is replaced by a bound_api
+    assert isinstance(PyListObject.__dict__["GetItem"], bound_api)
+    assert "GetItem" not in vars(py_list)
+    assert PyListObject.GetItem(py_list, 0).contents.into_object() == 1
+
+
+def test_first_access_same():
+    class Foo:
+        __slots__ = ()
+
+        @bind_api(ctypes.pythonapi["PyObject_Hash"])
+        def bar(self: object) -> int:
+            pass
+
+    # Class access returns the FuncPtr, before and after the descriptor is replaced
+    first = Foo.bar
+    assert isinstance(Foo.__dict__["bar"], bound_api)
+    assert Foo.bar is first
+    assert first(Foo.__name__) == hash(Foo.__name__)
+    # Instance access binds the FuncPtr directly
+    foo = Foo()
+    assert foo.bar.__func__ is first
+    assert foo.bar() == hash(foo)
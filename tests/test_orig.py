@@ -44,3 +44,32 @@ def test_get_type_cache() -> None:
     try_cache_attr(A, "abc")
 
     assert get_type_cache(A) == {"abc": 123}
+
+
+def test_cache_lookup_no_entry() -> None:
+    class A:
+        pass
+
+    # Lookups of uncached types don't add them to cache
+    assert not in_cache(A, "abc")
+    with pytest.raises(KeyError):
+        get_cache(A, "abc")
+    with pytest.raises(KeyError):
+        get_type_cache(A)
+
+
+def test_orig_no_entry() -> None:
+    class A:
+        pass
+
+    # Creating an orig doesn't add the type to cache, until an attribute is cached
+    a_orig = orig(A)
+    with pytest.raises(KeyError):
+        get_type_cache(A)
+
+    A.abc = 123
+    assert a_orig.abc == 123
+    assert get_type_cache(A) == {"abc": 123}
+    # The original attribute stays cached after the type changes
+    A.abc = 456
+    assert a_orig.abc == 123
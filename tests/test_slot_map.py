@@ -14,3 +14,16 @@ from einspect.structs.slots_map import Slot, get_slot
 )
 def test_get_slot(name, expected):
     assert get_slot(name) == expected
+
+
+def test_get_slot_cached():
+    assert get_slot("__add__") is get_slot("__add__")
+    assert get_slot("__add__", prefer="mapping") == get_slot("__add__")
+
+
+def test_slot_attrs():
+    slot = get_slot("__add__")
+    assert (slot.owner_attr, slot.sub_attr) == ("tp_as_number", "nb_add")
+    slot = get_slot("__repr__")
+    assert (slot.owner_attr, slot.sub_attr) == ("tp_repr", None)
+    assert slot.parts == ("tp_repr",)